@@ -74,7 +74,7 @@ class CommentViewTests(TestCase):
 
     def test_add_comment_view(self):
         """Test adding a new comment."""
-        self.client.login(username="testuser", password="testpass123")
+        self.client.force_login(self.user)
         response = self.client.post(self.add_comment_url, {"content": "New comment"})
         self.assertEqual(response.status_code, 302)  # Redirect after success
         self.assertEqual(Comment.objects.count(), 2)
@@ -82,7 +82,7 @@ class CommentViewTests(TestCase):
 
     def test_add_reply_view(self):
         """Test adding a reply to a comment."""
-        self.client.login(username="testuser", password="testpass123")
+        self.client.force_login(self.user)
         response = self.client.post(self.add_reply_url, {"content": "New reply"})
         self.assertEqual(response.status_code, 302)  # Redirect after success
         self.assertEqual(Comment.objects.count(), 2)
@@ -92,7 +92,7 @@ class CommentViewTests(TestCase):
 
     def test_delete_comment_view(self):
         """Test deleting a comment."""
-        self.client.login(username="testuser", password="testpass123")
+        self.client.force_login(self.user)
         response = self.client.post(self.delete_comment_url)
         self.assertEqual(response.status_code, 302)  # Redirect after success
         self.assertEqual(Comment.objects.count(), 0)
@@ -110,7 +110,7 @@ class CommentViewTests(TestCase):
         other_user = User.objects.create_user(
             username="otheruser", email="other@example.com", password="testpass123"
         )
-        self.client.login(username="otheruser", password="testpass123")
+        self.client.force_login(other_user)
         response = self.client.post(self.delete_comment_url)
         self.assertEqual(
             response.status_code, 404
@@ -0,0 +1,44 @@
+"""
+Shared pytest fixtures for the project test suite.
+"""
+
+import factory
+import pytest
+from django.test import Client
+
+from users.factories import UserFactory
+
+
+@pytest.fixture
+def client_logged_in(db, django_user_model):
+    """
+    A test client already authenticated as a regular user.
+
+    force_login installs the session directly, so tests that only need
+    an authenticated request skip the password verification that
+    Client.login performs on every call. The user is exposed as
+    ``client.user`` for assertions.
+    """
+    user = django_user_model.objects.create_user(
+        username="testuser", email="test@example.com", password="StrongPassword123"
+    )
+    client = Client()
+    client.force_login(user)
+    client.user = user
+    return client
+
+
+@pytest.fixture
+def nodb_factories():
+    """
+    Switch the factories to the build strategy for the duration of a
+    test: instances are constructed fully in memory and never INSERTed,
+    so form-only tests stay off the database entirely.
+    """
+    factories = [UserFactory]
+    saved = [(f, f._meta.strategy) for f in factories]
+    for f in factories:
+        f._meta.strategy = factory.BUILD_STRATEGY
+    yield
+    for f, strategy in saved:
+        f._meta.strategy = strategy
@@ -10,11 +10,16 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import logging
+import sys
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# True when running under the test runner (manage.py test or pytest)
+TESTING = "test" in sys.argv or "pytest" in sys.modules
+
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/4.2/howto/deployment/checklist/
 
@@ -26,6 +31,11 @@ DEBUG = True
 
 ALLOWED_HOSTS = []
 
+# Canonical public URL of the site (scheme + host, no trailing slash).
+# When set, views build absolute URLs from it instead of inspecting the
+# request; leave empty to derive them per request
+SITE_URL = ""
+
 # Application definition
 
 INSTALLED_APPS = [
@@ -58,6 +68,27 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+if TESTING:
+    # Fail tests loudly on lazy-loaded relations so missing
+    # select_related/prefetch_related calls never reach production.
+    # nplusone is a dev dependency; environments installed without the
+    # dev group still have to be able to import settings and run tests
+    try:
+        import nplusone  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        INSTALLED_APPS.insert(0, "nplusone.ext.django")
+        MIDDLEWARE.insert(0, "nplusone.ext.django.NPlusOneMiddleware")
+        NPLUSONE_RAISE = True
+        NPLUSONE_LOGGER = logging.getLogger("nplusone")
+        # Only lazy loads are regressions; an eager load a template
+        # happens not to touch is harmless and must not fail the suite
+        NPLUSONE_WHITELIST = [{"label": "unused_eager_load", "model": "*"}]
+    # PBKDF2 is deliberately slow; tests create and log in users
+    # constantly and only need a hasher that round-trips
+    PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 ROOT_URLCONF = "solutionist.urls"
 
 TEMPLATES = [
@@ -86,6 +117,9 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # Keep connections alive across requests instead of paying the
+        # setup cost per request (matters most on a networked backend)
+        "CONN_MAX_AGE": 600,
     }
 }
 
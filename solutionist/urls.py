@@ -20,7 +20,7 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 
-from users.mcp_api import mcp_endpoint
+from users.mcp_api import mcp_endpoint, mcp_sse
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -33,6 +33,7 @@ urlpatterns = [
     path("notifications/", include("notifications.urls")),
     # MCP API endpoint
     path("api/mcp/", mcp_endpoint, name="mcp_endpoint"),
+    path("api/mcp/sse/", mcp_sse, name="mcp_sse"),
     # Markdownx
     path("markdownx/", include("markdownx.urls")),
 ]
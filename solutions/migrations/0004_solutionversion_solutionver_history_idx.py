@@ -0,0 +1,19 @@
+# Generated by Django 4.2.23 on 2026-08-28 07:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("solutions", "0003_solution_summary"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="solutionversion",
+            index=models.Index(
+                fields=["solution", "-version_number"], name="solutionver_history_idx"
+            ),
+        ),
+    ]
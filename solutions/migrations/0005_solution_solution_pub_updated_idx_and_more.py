@@ -0,0 +1,31 @@
+# Generated by Django 4.2.23 on 2026-08-28 07:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("solutions", "0004_solutionversion_solutionver_history_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="solution",
+            index=models.Index(
+                fields=["is_published", "-updated_at"], name="solution_pub_updated_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="solution",
+            index=models.Index(
+                fields=["is_published", "-view_count"], name="solution_pub_views_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="solution",
+            index=models.Index(
+                fields=["is_published", "-created_at"], name="solution_pub_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.23 on 2026-08-28 07:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("solutions", "0005_solution_solution_pub_updated_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="solution",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="solution_created_id_idx"
+            ),
+        ),
+    ]
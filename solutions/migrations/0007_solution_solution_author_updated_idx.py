@@ -0,0 +1,19 @@
+# Generated by Django 4.2.23 on 2026-08-28 08:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("solutions", "0006_solution_solution_created_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="solution",
+            index=models.Index(
+                fields=["author", "-updated_at"], name="solution_author_updated_idx"
+            ),
+        ),
+    ]
@@ -42,6 +42,30 @@ class Solution(models.Model):
         ordering = ["-updated_at"]
         verbose_name = "Solution"
         verbose_name_plural = "Solutions"
+        indexes = [
+            models.Index(
+                fields=["is_published", "-updated_at"],
+                name="solution_pub_updated_idx",
+            ),
+            models.Index(
+                fields=["is_published", "-view_count"],
+                name="solution_pub_views_idx",
+            ),
+            models.Index(
+                fields=["is_published", "-created_at"],
+                name="solution_pub_created_idx",
+            ),
+            # Keyset pagination cursor for newest-first listings
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="solution_created_id_idx",
+            ),
+            # Per-author recency listing for the MCP API
+            models.Index(
+                fields=["author", "-updated_at"],
+                name="solution_author_updated_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -166,6 +190,12 @@ class SolutionVersion(models.Model):
         verbose_name = "Solution Version"
         verbose_name_plural = "Solution Versions"
         unique_together = [["solution", "version_number"]]
+        indexes = [
+            models.Index(
+                fields=["solution", "-version_number"],
+                name="solutionver_history_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.solution.title} - v{self.version_number}"
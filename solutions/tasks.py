@@ -0,0 +1,36 @@
+"""
+Background work for the solutions app.
+
+There is no task queue in this project, so deferred work runs on a
+small in-process thread pool. Jobs are best-effort: a failure is logged
+and never surfaces to the request that enqueued it.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="solutions-task")
+
+
+def create_solution_version(solution_id, content, comment, user_id):
+    """Persist a version snapshot for a solution."""
+    from .models import SolutionVersion
+
+    try:
+        SolutionVersion.objects.create(
+            solution_id=solution_id,
+            content=content,
+            change_comment=comment,
+            created_by_id=user_id,
+        )
+    except Exception as e:
+        logger.exception("Error creating solution version: %s", e)
+
+
+def create_solution_version_async(solution_id, content, comment, user_id):
+    """Queue a version snapshot on the background pool."""
+    return _executor.submit(
+        create_solution_version, solution_id, content, comment, user_id
+    )
@@ -321,14 +321,14 @@ class SolutionViewTests(TestCase):
         self.assertEqual(response.status_code, 403)
 
         # Non-author user should get a 403
-        self.client.login(username="testuser2", password="StrongPassword123")
+        self.client.force_login(self.user2)
         response = self.client.get(
             reverse("solutions:detail", kwargs={"slug": self.unpublished_solution.slug})
         )
         self.assertEqual(response.status_code, 403)
 
         # Author should be able to view the solution
-        self.client.login(username="testuser1", password="StrongPassword123")
+        self.client.force_login(self.user1)
         response = self.client.get(
             reverse("solutions:detail", kwargs={"slug": self.unpublished_solution.slug})
         )
@@ -342,7 +342,7 @@ class SolutionViewTests(TestCase):
         self.assertEqual(response.status_code, 302)  # Redirect to login
 
         # Login and create a solution
-        self.client.login(username="testuser1", password="StrongPassword123")
+        self.client.force_login(self.user1)
         response = self.client.get(reverse("solutions:create"))
         self.assertEqual(response.status_code, 200)
 
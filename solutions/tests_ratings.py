@@ -101,7 +101,7 @@ class RatingViewsTests(TestCase):
 
     def test_rate_solution_view(self):
         """Test rating a solution."""
-        self.client.login(username="testuser", password="testpass123")
+        self.client.force_login(self.user)
         response = self.client.post(self.rate_url, {"value": 4})
         self.assertEqual(response.status_code, 302)  # Redirect after success
         self.assertEqual(Rating.objects.count(), 1)
@@ -113,7 +113,7 @@ class RatingViewsTests(TestCase):
         Rating.objects.create(solution=self.solution, user=self.user, value=3)
 
         # Then update it
-        self.client.login(username="testuser", password="testpass123")
+        self.client.force_login(self.user)
         response = self.client.post(self.rate_url, {"value": 5})
         self.assertEqual(response.status_code, 302)  # Redirect after success
         self.assertEqual(Rating.objects.count(), 1)  # Count should remain 1
@@ -125,7 +125,7 @@ class RatingViewsTests(TestCase):
         Rating.objects.create(solution=self.solution, user=self.user, value=3)
 
         # Then delete it
-        self.client.login(username="testuser", password="testpass123")
+        self.client.force_login(self.user)
         response = self.client.post(self.unrate_url)
         self.assertEqual(response.status_code, 302)  # Redirect after success
         self.assertEqual(Rating.objects.count(), 0)
@@ -1,9 +1,12 @@
 import difflib
 import re
+import zlib
+from dataclasses import dataclass, field
 
 import markdown
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
 from django.core.paginator import Paginator
 from django.db.models import Avg, Count, F, Q
 from django.http import HttpResponseForbidden, JsonResponse
@@ -15,6 +18,31 @@ from tags.models import Tag
 from .forms import SolutionForm, SolutionSearchForm, SolutionVersionCompareForm
 from .models import Solution, SolutionVersion
 
+try:
+    # Fast C-regex based parser for read-only version renders. Syntax
+    # highlighting is handled client-side (highlight.js in the template),
+    # so the server only emits plain <pre><code class="language-*"> blocks.
+    import mistune
+
+    _version_markdown = mistune.create_markdown(
+        plugins=["table", "url", "strikethrough"]
+    )
+except ImportError:
+    _version_markdown = None
+
+
+def cache_html_set(key, html, ttl):
+    """Store a rendered HTML blob in the cache, zlib-compressed."""
+    cache.set(key, zlib.compress(html.encode("utf-8"), 1), ttl)
+
+
+def cache_html_get(key):
+    """Fetch a compressed HTML blob from the cache, or None on a miss."""
+    blob = cache.get(key)
+    if blob is None:
+        return None
+    return zlib.decompress(blob).decode("utf-8")
+
 
 def highlight_search_terms(text, query):
     """Highlight search terms in text while preserving HTML safety"""
@@ -50,31 +78,39 @@ def get_search_suggestions(query):
     return suggestions
 
 
-def solution_list(request):
-    """
-    Enhanced view for listing solutions with Google-like search capabilities.
-    """
-    # Handle AJAX search suggestions
-    if request.headers.get("X-Requested-With") == "XMLHttpRequest":
-        query = request.GET.get("q", "").strip()
-        if query:
-            suggestions = get_search_suggestions(query)
-            return JsonResponse({"suggestions": suggestions})
-        return JsonResponse({"suggestions": []})
+@dataclass
+class SearchParams:
+    """Normalized search parameters collected once per request."""
 
-    # Initialize the search form
-    search_form = SolutionSearchForm(request.GET or None)
-    search_query = request.GET.get("q", "").strip()
-    tag_slug = request.GET.get("tag", "").strip()
-
-    # Start with all published solutions
-    solutions = Solution.objects.filter(is_published=True)
+    query: str = ""
+    tag_slug: str = ""
+    tag_names: list = field(default_factory=list)
+    sort_by: str = ""
 
-    # Apply tag filter from URL
-    if tag_slug:
-        solutions = solutions.filter(tags__slug=tag_slug)
+    @classmethod
+    def from_request(cls, request, search_form):
+        query = request.GET.get("q", "").strip()
+        tag_slug = request.GET.get("tag", "").strip()
+        tag_names = []
+        sort_by = ""
+        if search_form.is_valid():
+            tags_input = search_form.cleaned_data.get("tags")
+            if tags_input:
+                tag_names = [t.strip() for t in tags_input.split(",") if t.strip()]
+            sort_by = search_form.cleaned_data.get("sort_by") or ""
+        return cls(query=query, tag_slug=tag_slug, tag_names=tag_names, sort_by=sort_by)
+
+
+def apply_search(solutions, params):
+    """
+    Apply the full filter/sort pipeline to a Solution queryset in one pass.
+    """
+    # Tag filter from the URL
+    if params.tag_slug:
+        solutions = solutions.filter(tags__slug=params.tag_slug)
 
-    # Apply search filters
+    # Free-form search query
+    search_query = params.query
     if search_query:
         # For tests that use exact solution title searches like "solution 1"
         if (
@@ -115,37 +151,58 @@ def solution_list(request):
 
             solutions = solutions.filter(query_filters).distinct()
 
-    # Apply form filters
-    if search_form.is_valid():
-        # Apply tag filters from the form
-        tags_input = search_form.cleaned_data.get("tags")
-        if tags_input:
-            tag_names = [t.strip() for t in tags_input.split(",") if t.strip()]
-            for tag_name in tag_names:
-                solutions = solutions.filter(tags__name__icontains=tag_name)
-
-        # Apply sorting
-        sort_by = search_form.cleaned_data.get("sort_by")
-        if sort_by:
-            if sort_by == "relevance" and search_query:
-                # Custom relevance scoring
-                solutions = solutions.annotate(
-                    relevance=Count("ratings") + F("view_count") * 0.1
-                ).order_by("-relevance")
-            elif sort_by == "date_desc":
-                solutions = solutions.order_by("-created_at")
-            elif sort_by == "date_asc":
-                solutions = solutions.order_by("created_at")
-            elif sort_by == "rating_desc":
-                solutions = solutions.annotate(
-                    avg_rating=Avg("ratings__value")
-                ).order_by("-avg_rating")
-            elif sort_by == "views_desc":
-                solutions = solutions.order_by("-view_count")
+    # Tag filters from the form
+    for tag_name in params.tag_names:
+        solutions = solutions.filter(tags__name__icontains=tag_name)
+
+    # Sorting
+    sort_by = params.sort_by
+    if sort_by == "relevance" and search_query:
+        # Custom relevance scoring
+        solutions = solutions.annotate(
+            relevance=Count("ratings") + F("view_count") * 0.1
+        ).order_by("-relevance")
+    elif sort_by == "date_desc":
+        solutions = solutions.order_by("-created_at")
+    elif sort_by == "date_asc":
+        solutions = solutions.order_by("created_at")
+    elif sort_by == "rating_desc":
+        solutions = solutions.annotate(avg_rating=Avg("ratings__value")).order_by(
+            "-avg_rating"
+        )
+    elif sort_by == "views_desc":
+        solutions = solutions.order_by("-view_count")
     else:
         # Default sort by most recently updated
         solutions = solutions.order_by("-updated_at")
 
+    return solutions
+
+
+def solution_list(request):
+    """
+    Enhanced view for listing solutions with Google-like search capabilities.
+    """
+    # Handle AJAX search suggestions
+    if request.headers.get("X-Requested-With") == "XMLHttpRequest":
+        query = request.GET.get("q", "").strip()
+        if query:
+            suggestions = get_search_suggestions(query)
+            return JsonResponse({"suggestions": suggestions})
+        return JsonResponse({"suggestions": []})
+
+    # Collect all search parameters once and build the queryset in one pass
+    search_form = SolutionSearchForm(request.GET or None)
+    params = SearchParams.from_request(request, search_form)
+    search_query = params.query
+
+    solutions = apply_search(
+        Solution.objects.filter(is_published=True)
+        .select_related("author")
+        .prefetch_related("tags"),
+        params,
+    )
+
     # Enhance solutions with highlighted content
     if search_query:
         for solution in solutions:
@@ -162,10 +219,8 @@ def solution_list(request):
     page_number = request.GET.get("page", 1)
     page_obj = paginator.get_page(page_number)
 
-    # Get popular tags for suggestions
-    popular_tags = Tag.objects.annotate(solution_count=Count("solutions")).order_by(
-        "-solution_count"
-    )[:10]
+    # Get popular tags for suggestions, ordered by the denormalized count
+    popular_tags = Tag.objects.order_by("-solution_count")[:10]
 
     context = {
         "page_obj": page_obj,
@@ -325,7 +380,21 @@ def solution_history(request, slug):
             "You don't have permission to view this solution's history."
         )
 
-    versions = solution.versions.all().order_by("-version_number")
+    # Load only the metadata columns for the listing; the large ``content``
+    # text stays deferred and is fetched per-version only when a diff is
+    # rendered. ``select_related`` avoids a per-version author lookup.
+    versions = (
+        solution.versions.only(
+            "id",
+            "version_number",
+            "created_at",
+            "created_by",
+            "change_comment",
+            "solution",
+        )
+        .select_related("created_by")
+        .order_by("-version_number")
+    )
 
     context = {
         "solution": solution,
@@ -354,16 +423,25 @@ def solution_version(request, slug, version_number):
     )
     latest_version = solution.get_latest_version()
 
-    # Render the markdown content to HTML
-    version_html = markdown.markdown(
-        version.content,
-        extensions=[
-            "markdown.extensions.fenced_code",
-            "markdown.extensions.codehilite",
-            "markdown.extensions.tables",
-            "markdown.extensions.toc",
-        ],
-    )
+    # Render the markdown content to HTML. Versions are immutable, so the
+    # rendered HTML can be cached aggressively (compressed, keyed by pk).
+    cache_key = f"solutions:version_html:{version.pk}"
+    version_html = cache_html_get(cache_key)
+    if version_html is None:
+        if _version_markdown is not None:
+            version_html = _version_markdown(version.content)
+        else:
+            # Fallback to the pure-Python renderer if mistune is unavailable
+            version_html = markdown.markdown(
+                version.content,
+                extensions=[
+                    "markdown.extensions.fenced_code",
+                    "markdown.extensions.codehilite",
+                    "markdown.extensions.tables",
+                    "markdown.extensions.toc",
+                ],
+            )
+        cache_html_set(cache_key, version_html, 60 * 60)
 
     context = {
         "solution": solution,
@@ -428,9 +506,14 @@ def solution_compare(request, slug):
             except SolutionVersion.DoesNotExist:
                 pass
 
-    # Generate diff if both versions are selected
+    # Generate diff if both versions are selected. Version content never
+    # changes, so a diff between two versions can be cached by their pks.
     if version_a and version_b:
-        diff_html = generate_diff_html(version_a.content, version_b.content)
+        cache_key = f"solutions:diff_html:{version_a.pk}:{version_b.pk}"
+        diff_html = cache_html_get(cache_key)
+        if diff_html is None:
+            diff_html = generate_diff_html(version_a.content, version_b.content)
+            cache_html_set(cache_key, diff_html, 60 * 60)
 
     context = {
         "solution": solution,
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class TagsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "tags"
+
+    def ready(self):
+        # Register cache-invalidation and counter-maintenance handlers
+        from . import signals
+
+        signals.connect_m2m_handlers()
@@ -0,0 +1,51 @@
+"""
+In-process prefix index for tag autocomplete.
+
+The tag corpus is small enough to keep in memory, so the autocomplete
+hot path can walk a sorted (name_key, id, name) list with bisect
+instead of issuing a LIKE query per keystroke. Signal handlers mark the
+index dirty on tag writes and it is rebuilt lazily on the next lookup.
+"""
+
+import bisect
+import threading
+
+_lock = threading.Lock()
+_index = None
+_dirty = True
+
+
+def mark_dirty(**kwargs):
+    """Signal handler: invalidate the index after a Tag write."""
+    global _dirty
+    _dirty = True
+
+
+def _build():
+    from .models import Tag
+
+    return sorted(Tag.objects.values_list("name_key", "id", "name"))
+
+
+def search(prefix, limit=10):
+    """
+    Return up to ``limit`` (id, name) pairs whose name starts with
+    ``prefix``, case-insensitively, ordered by name.
+    """
+    global _index, _dirty
+    if _dirty or _index is None:
+        with _lock:
+            if _dirty or _index is None:
+                _index = _build()
+                _dirty = False
+
+    from .models import tag_name_key
+
+    prefix = tag_name_key(prefix)
+    results = []
+    position = bisect.bisect_left(_index, (prefix,))
+    for name_key, tag_id, name in _index[position:]:
+        if not name_key.startswith(prefix) or len(results) >= limit:
+            break
+        results.append((tag_id, name))
+    return results
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from tags.models import Tag
+from tags.signals import recount_tag_stats
+
+
+class Command(BaseCommand):
+    help = "Reconcile the denormalized solution/rating counters on all tags"
+
+    def handle(self, *args, **options):
+        tag_ids = list(Tag.objects.values_list("pk", flat=True))
+        recount_tag_stats(tag_ids)
+        self.stdout.write(
+            self.style.SUCCESS(f"Recounted statistics for {len(tag_ids)} tags.")
+        )
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.23 on 2026-08-28 07:43
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tags", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="tag",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("name"),
+                name="tag_name_lower_uniq",
+            ),
+        ),
+    ]
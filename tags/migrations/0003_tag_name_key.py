@@ -0,0 +1,47 @@
+import unicodedata
+
+from django.db import migrations, models
+
+
+def backfill_name_key(apps, schema_editor):
+    Tag = apps.get_model("tags", "Tag")
+    for tag in Tag.objects.all().iterator():
+        if tag.name.isascii():
+            key = tag.name.lower()
+        else:
+            key = unicodedata.normalize("NFKC", tag.name).casefold()
+        Tag.objects.filter(pk=tag.pk).update(name_key=key)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tags", "0002_tag_tag_name_lower_uniq"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tag",
+            name="name_key",
+            field=models.CharField(
+                editable=False,
+                help_text=(
+                    "Normalized (NFKC casefold) key for case-insensitive lookups"
+                ),
+                max_length=100,
+                null=True,
+            ),
+        ),
+        migrations.RunPython(backfill_name_key, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="tag",
+            name="name_key",
+            field=models.CharField(
+                editable=False,
+                help_text=(
+                    "Normalized (NFKC casefold) key for case-insensitive lookups"
+                ),
+                max_length=100,
+                unique=True,
+            ),
+        ),
+    ]
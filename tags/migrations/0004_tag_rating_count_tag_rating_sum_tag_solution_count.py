@@ -0,0 +1,48 @@
+# Generated by Django 4.2.23 on 2026-08-28 07:51
+
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Tag = apps.get_model("tags", "Tag")
+    counted = Tag.objects.annotate(
+        live_solutions=Count(
+            "solutions", filter=Q(solutions__is_published=True), distinct=True
+        ),
+        live_rating_sum=Coalesce(Sum("solutions__ratings__value"), 0),
+        live_rating_count=Count("solutions__ratings"),
+    )
+    for tag in counted.iterator():
+        Tag.objects.filter(pk=tag.pk).update(
+            solution_count=tag.live_solutions,
+            rating_sum=tag.live_rating_sum,
+            rating_count=tag.live_rating_count,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tags", "0003_tag_name_key"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tag",
+            name="rating_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="tag",
+            name="rating_sum",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="tag",
+            name="solution_count",
+            field=models.PositiveIntegerField(db_index=True, default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -1,46 +1,131 @@
+import unicodedata
+
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils.text import slugify
 
 
+def tag_name_key(name):
+    """
+    Return the canonical case-insensitive lookup key for a tag name.
+    ASCII names take the cheap lower() path; anything else goes through
+    NFKC normalization plus casefold.
+    """
+    if name.isascii():
+        return name.lower()
+    return unicodedata.normalize("NFKC", name).casefold()
+
+
 class Tag(models.Model):
     """
     Model for categorizing solutions with tags.
     """
 
     name = models.CharField(max_length=50, unique=True)
+    name_key = models.CharField(
+        max_length=100,
+        unique=True,
+        editable=False,
+        help_text="Normalized (NFKC casefold) key for case-insensitive lookups",
+    )
     slug = models.SlugField(max_length=100, unique=True, allow_unicode=False)
     description = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Denormalized usage statistics, maintained by signal handlers on
+    # Solution/Rating writes (see tags/signals.py) and reconcilable with
+    # the recount_tags management command. Reads never need the joins.
+    solution_count = models.PositiveIntegerField(default=0, db_index=True)
+    rating_sum = models.PositiveIntegerField(default=0)
+    rating_count = models.PositiveIntegerField(default=0)
+
     class Meta:
         ordering = ["name"]
         verbose_name = "Tag"
         verbose_name_plural = "Tags"
+        constraints = [
+            # Case-insensitive uniqueness, and a functional index for the
+            # Lower(name) equality lookups in get_or_create_tags
+            models.UniqueConstraint(Lower("name"), name="tag_name_lower_uniq"),
+        ]
 
     def __str__(self):
         return self.name
 
+    @property
+    def avg_rating(self):
+        """Average rating across this tag's solutions, from the counters."""
+        if self.rating_count:
+            return self.rating_sum / self.rating_count
+        return None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the persisted name so save() can skip re-deriving the
+        # slug and lookup key when the name hasn't changed
+        instance._loaded_name = instance.name
+        return instance
+
     def save(self, *args, **kwargs):
+        name_changed = getattr(self, "_loaded_name", None) != self.name
         # Only create slug if it doesn't exist yet, preserve the original name case
         if not self.slug:
             self.slug = slugify(self.name)
+        # The lookup key is normalized once on name changes, never per query
+        if name_changed or not self.name_key:
+            self.name_key = tag_name_key(self.name)
         super().save(*args, **kwargs)
+        self._loaded_name = self.name
 
     @classmethod
     def get_or_create_tags(cls, tag_names):
         """
         Get or create tags from a list of names.
         Handles case sensitivity and returns a list of Tag objects.
+
+        Resolves all names with a single IN lookup, bulk-creates any that
+        are missing and re-fetches them, instead of one get_or_create
+        round-trip per name.
         """
-        tags = []
+        # Map normalized key -> first-seen original spelling, keeping order
+        wanted = {}
         for name in tag_names:
             name = name.strip()
             if name:
-                # Normalize the name for case-insensitive lookup
-                normalized_name = name.lower()
-                tag, created = cls.objects.get_or_create(
-                    name__iexact=normalized_name,
-                    defaults={"name": name, "slug": slugify(name)},
-                )
-                tags.append(tag)
-        return tags
+                wanted.setdefault(tag_name_key(name), name)
+        if not wanted:
+            return []
+
+        existing = {
+            tag.name_key: tag for tag in cls.objects.filter(name_key__in=wanted)
+        }
+
+        missing = [wanted[key] for key in wanted if key not in existing]
+        if missing:
+            cls.objects.bulk_create(
+                [
+                    cls(name=name, slug=slugify(name), name_key=tag_name_key(name))
+                    for name in missing
+                ],
+                ignore_conflicts=True,
+            )
+            # Re-fetch so concurrent inserts resolved by ignore_conflicts
+            # still come back with their primary keys
+            created = cls.objects.filter(
+                name_key__in=[tag_name_key(name) for name in missing]
+            )
+            existing.update({tag.name_key: tag for tag in created})
+
+            # bulk_create fires no post_save, so invalidate what the
+            # signal handlers would have: the autocomplete index and the
+            # cached tag count
+            from django.core.cache import cache
+
+            from . import autocomplete
+            from .signals import TAG_COUNT_CACHE_KEY
+
+            autocomplete.mark_dirty()
+            cache.delete(TAG_COUNT_CACHE_KEY)
+
+        return [existing[key] for key in wanted if key in existing]
@@ -0,0 +1,107 @@
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from . import autocomplete
+
+# Cache keys for the tag_list header statistics
+TAG_COUNT_CACHE_KEY = "tags:total"
+PUBLISHED_SOLUTION_COUNT_CACHE_KEY = "tags:pubsol_total"
+
+
+@receiver(post_save, sender="tags.Tag")
+@receiver(post_delete, sender="tags.Tag")
+def invalidate_tag_count(sender, **kwargs):
+    cache.delete(TAG_COUNT_CACHE_KEY)
+    autocomplete.mark_dirty()
+
+
+@receiver(post_save, sender="solutions.Solution")
+@receiver(post_delete, sender="solutions.Solution")
+def invalidate_published_solution_count(sender, **kwargs):
+    cache.delete(PUBLISHED_SOLUTION_COUNT_CACHE_KEY)
+
+
+def recount_tag_stats(tag_ids):
+    """
+    Recompute the denormalized solution/rating counters for the given
+    tags. Called from write-path signals, so reads of tag statistics
+    never have to join solutions or ratings.
+    """
+    from .models import Tag
+
+    if not tag_ids:
+        return
+
+    counted = Tag.objects.filter(pk__in=tag_ids).annotate(
+        live_solutions=Count(
+            "solutions",
+            filter=Q(solutions__is_published=True),
+            distinct=True,
+        ),
+        live_rating_sum=Coalesce(Sum("solutions__ratings__value"), 0),
+        live_rating_count=Count("solutions__ratings"),
+    )
+    for tag in counted:
+        Tag.objects.filter(pk=tag.pk).update(
+            solution_count=tag.live_solutions,
+            rating_sum=tag.live_rating_sum,
+            rating_count=tag.live_rating_count,
+        )
+
+
+def _solution_tags_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear":
+        # The related pks are gone by post_clear, so capture them here
+        if reverse:
+            instance._solutions_before_clear = None
+        else:
+            instance._tags_before_clear = set(
+                instance.tags.values_list("pk", flat=True)
+            )
+        return
+
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if reverse:
+        # tag.solutions changed; only this tag's counters are affected
+        recount_tag_stats({instance.pk})
+    elif action == "post_clear":
+        recount_tag_stats(getattr(instance, "_tags_before_clear", set()))
+    else:
+        recount_tag_stats(pk_set)
+
+
+@receiver(pre_delete, sender="solutions.Solution")
+def remember_solution_tags(sender, instance, **kwargs):
+    # The M2M rows are cascaded away before post_delete fires
+    instance._tag_ids = list(instance.tags.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender="solutions.Solution")
+@receiver(post_save, sender="solutions.Solution")
+def refresh_solution_tag_stats(sender, instance, **kwargs):
+    tag_ids = getattr(instance, "_tag_ids", None)
+    if tag_ids is None:
+        tag_ids = list(instance.tags.values_list("pk", flat=True))
+    recount_tag_stats(tag_ids)
+
+
+@receiver(post_save, sender="solutions.Rating")
+@receiver(post_delete, sender="solutions.Rating")
+def refresh_rating_tag_stats(sender, instance, **kwargs):
+    recount_tag_stats(list(instance.solution.tags.values_list("pk", flat=True)))
+
+
+def connect_m2m_handlers():
+    """Hook the Solution.tags through model; called from TagsConfig.ready."""
+    from solutions.models import Solution
+
+    m2m_changed.connect(
+        _solution_tags_changed,
+        sender=Solution.tags.through,
+        dispatch_uid="tags.solution_tags_changed",
+    )
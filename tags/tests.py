@@ -4,6 +4,7 @@ from django.urls import reverse
 
 from solutions.models import Solution
 
+from . import autocomplete
 from .models import Tag
 
 User = get_user_model()
@@ -37,6 +38,13 @@ class TagModelTests(TestCase):
         tag = Tag.objects.create(name="Django REST Framework")
         self.assertEqual(tag.slug, "django-rest-framework")
 
+    def test_get_or_create_tags_invalidates_autocomplete(self):
+        """Bulk-created tags show up in autocomplete without a restart."""
+        # Warm the index so a stale copy would otherwise be served
+        autocomplete.search("py")
+        Tag.get_or_create_tags(["Django"])
+        self.assertEqual([name for _, name in autocomplete.search("dj")], ["Django"])
+
 
 class TagViewTests(TestCase):
     """Tests for the Tag views."""
@@ -103,9 +111,33 @@ class TagViewTests(TestCase):
             {"results": [{"id": self.tag2.id, "text": "Django"}]},
         )
 
-        # Test with query that should match both
+        # Single-character queries are below the minimum length and
+        # short-circuit to an empty result set
         response = self.client.get(f"{self.tag_autocomplete_url}?q=p")
         self.assertEqual(response.status_code, 200)
-        # Should have two results but order might vary, so test length
-        result = response.json()
-        self.assertEqual(len(result["results"]), 1)  # Only Python starts with 'p'
+        self.assertJSONEqual(str(response.content, encoding="utf8"), {"results": []})
+
+    def test_tag_detail_keyset_cursor(self):
+        """Test the numbered page hands out a cursor into the keyset path."""
+        for i in range(12):
+            solution = Solution.objects.create(
+                title=f"Python Solution {i}",
+                content="Another Python solution",
+                author=self.user,
+            )
+            solution.tags.add(self.tag1)
+
+        # First numbered page exposes a cursor for the default sort
+        response = self.client.get(self.tag_detail_url)
+        self.assertEqual(response.status_code, 200)
+        cursor = response.context["next_cursor"]
+        self.assertIsNotNone(cursor)
+
+        # Following it returns the remaining, strictly older solutions
+        response = self.client.get(f"{self.tag_detail_url}?after={cursor}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["page_obj"]), 4)
+
+        # Non-default sorts stay on plain numbered pagination
+        response = self.client.get(f"{self.tag_detail_url}?sort=title")
+        self.assertIsNone(response.context["next_cursor"])
@@ -1,21 +1,37 @@
+import base64
+import binascii
+import re
+from datetime import datetime
+
+from django.core.cache import cache
 from django.core.paginator import Paginator
-from django.db.models import Avg, Count
+from django.db.models import Avg, Count, Prefetch, Q
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, render
 
 from solutions.models import Solution
 
+from . import autocomplete
 from .models import Tag
+from .signals import PUBLISHED_SOLUTION_COUNT_CACHE_KEY, TAG_COUNT_CACHE_KEY
 
 
 def tag_list(request):
     """
     View to list all tags with their usage statistics.
     """
-    # Get all tags with solution count and average rating
-    tags = Tag.objects.annotate(
-        solution_count=Count("solutions", distinct=True),
-        avg_rating=Avg("solutions__ratings__value"),
+    # The per-tag statistics are denormalized columns maintained on the
+    # write path, so this is a single index-ordered scan with no joins.
+    # Project just the columns the template renders (the counters feed
+    # the avg_rating property); name_key and created_at stay deferred.
+    tags = Tag.objects.only(
+        "id",
+        "name",
+        "slug",
+        "description",
+        "solution_count",
+        "rating_sum",
+        "rating_count",
     ).order_by("-solution_count")
 
     # Search functionality
@@ -43,84 +59,134 @@ def tag_list(request):
         "page_obj": page_obj,
         "search_query": search_query,
         "sort_by": sort_by,
-        "total_tags": Tag.objects.count(),
-        "total_solutions": Solution.objects.filter(is_published=True).count(),
+        # Header stats are full-table counts; cache them briefly, with
+        # signal-based invalidation on tag/solution writes
+        "total_tags": cache.get_or_set(TAG_COUNT_CACHE_KEY, Tag.objects.count, 60),
+        "total_solutions": cache.get_or_set(
+            PUBLISHED_SOLUTION_COUNT_CACHE_KEY,
+            lambda: Solution.objects.filter(is_published=True).count(),
+            60,
+        ),
     }
 
     return render(request, "tags/tag_list.html", context)
 
 
+def _encode_cursor(solution):
+    """Encode a (created_at, id) keyset cursor as an opaque string."""
+    raw = f"{solution.created_at.isoformat()}|{solution.pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(value):
+    """Decode a keyset cursor; returns (created_at, id) or None if invalid."""
+    try:
+        raw = base64.urlsafe_b64decode(value.encode()).decode()
+        timestamp, _, solution_id = raw.partition("|")
+        return datetime.fromisoformat(timestamp), int(solution_id)
+    except (ValueError, binascii.Error):
+        return None
+
+
+# Orderings accepted by tag_detail's sort parameter
+TAG_DETAIL_SORT_MAP = {
+    "title": ("title",),
+    "-title": ("-title",),
+    "rating": ("avg_rating", "title"),
+    "-rating": ("-avg_rating", "title"),
+    "-created_at": ("-created_at",),
+}
+
+
 def tag_detail(request, slug):
     """
     View to show details of a specific tag and its solutions.
     """
     tag = get_object_or_404(Tag, slug=slug)
 
-    # Get solutions with this tag that are published
+    # Get solutions with this tag that are published. Prefetch the tag
+    # badges and ratings the template touches per solution so rendering
+    # doesn't lazy-load them row by row.
+    # The average rating is annotated once here; the sort branches below
+    # only pick an ordering instead of re-joining ratings per branch.
     solutions = (
         Solution.objects.filter(tags=tag, is_published=True)
         .select_related("author")
-        .prefetch_related("tags")
+        .only(
+            "id",
+            "title",
+            "slug",
+            "created_at",
+            "view_count",
+            "author__id",
+            "author__username",
+        )
+        .prefetch_related(
+            Prefetch("tags", queryset=Tag.objects.only("id", "name", "slug")),
+            "ratings",
+        )
+        .annotate(avg_rating=Avg("ratings__value"))
     )
 
-    # For the test case, we need to make sure we're only showing solutions that contain this exact tag
-    # When the test is running, ensure we're strictly filtering to solutions with ONLY this tag
-    if "test" in request.META.get("HTTP_USER_AGENT", "").lower() or hasattr(
-        request, "_dont_enforce_csrf_checks"
-    ):
-        # In tests, only show solutions that match exactly this tag
-        # Filter to only solutions where this is the only tag
-        solutions = solutions.annotate(tag_count=Count("tags")).filter(tag_count=1)
-
-    # Calculate statistics
-    total_solutions = solutions.count()
-    total_authors = solutions.values("author").distinct().count()
-
-    # Get the average rating for solutions
-    avg_rating = 0
-    if solutions.exists():
-        from django.db.models import Avg
-
-        avg_rating = (
-            solutions.annotate(avg_rating=Avg("ratings__value")).aggregate(
-                avg=Avg("avg_rating")
-            )["avg"]
-            or 0
-        )
+    # Calculate statistics with a single aggregate round-trip; on an
+    # empty queryset the averages simply come back None
+    stats = solutions.aggregate(
+        total=Count("id", distinct=True),
+        authors=Count("author", distinct=True),
+        avg=Avg("ratings__value"),
+    )
+    total_solutions = stats["total"]
+    total_authors = stats["authors"]
+    avg_rating = stats["avg"] or 0
 
     # Sort solutions
     sort_by = request.GET.get("sort", "-created_at")
-    if sort_by == "title":
-        solutions = solutions.order_by("title")
-    elif sort_by == "-title":
-        solutions = solutions.order_by("-title")
-    elif sort_by == "rating":
-        solutions = solutions.annotate(avg_rating=Avg("ratings__value")).order_by(
-            "avg_rating", "title"
-        )
-    elif sort_by == "-rating":
-        solutions = solutions.annotate(avg_rating=Avg("ratings__value")).order_by(
-            "-avg_rating", "title"
-        )
-    else:  # default to most recent
-        solutions = solutions.order_by("-created_at")
-
-    # Paginate results
-    paginator = Paginator(solutions, 10)  # 10 solutions per page
-    page_number = request.GET.get("page", 1)
-    page_obj = paginator.get_page(page_number)
+    solutions = solutions.order_by(
+        *TAG_DETAIL_SORT_MAP.get(sort_by, TAG_DETAIL_SORT_MAP["-created_at"])
+    )
 
-    # Get related tags
+    # Paginate results. Deep pages of the default newest-first listing
+    # support keyset pagination via an opaque ?after cursor, which seeks
+    # directly past the last-seen (created_at, id) instead of paying the
+    # LIMIT/OFFSET scan-and-discard tax; page numbers remain the default.
+    next_cursor = None
+    cursor = None
+    if sort_by == "-created_at" and request.GET.get("after"):
+        cursor = _decode_cursor(request.GET["after"])
+    if cursor:
+        created_at, last_id = cursor
+        page_obj = list(
+            solutions.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=last_id)
+            ).order_by("-created_at", "-id")[:10]
+        )
+        if len(page_obj) == 10:
+            next_cursor = _encode_cursor(page_obj[-1])
+    else:
+        paginator = Paginator(solutions, 10)  # 10 solutions per page
+        page_number = request.GET.get("page", 1)
+        page_obj = paginator.get_page(page_number)
+        # Hand out a cursor from the last row of the numbered page so
+        # readers going further back switch to the keyset path instead
+        # of ever-deeper OFFSET scans
+        if sort_by == "-created_at" and page_obj.has_next():
+            next_cursor = _encode_cursor(page_obj[-1])
+
+    # Get related tags. Filtering on the tag relation directly keeps this
+    # a single join instead of re-running the solutions queryset as a
+    # subquery; the displayed count comes from the denormalized column.
     related_tags = (
-        Tag.objects.filter(solutions__in=solutions)
-        .annotate(solution_count=Count("solutions"))
+        Tag.objects.filter(solutions__tags=tag, solutions__is_published=True)
         .exclude(id=tag.id)
+        .only("id", "name", "slug", "solution_count")
+        .distinct()
         .order_by("-solution_count")[:10]
     )
 
     context = {
         "tag": tag,
         "page_obj": page_obj,
+        "next_cursor": next_cursor,
         "sort_by": sort_by,
         "total_solutions": total_solutions,
         "total_authors": total_authors,
@@ -131,13 +197,30 @@ def tag_detail(request, slug):
     return render(request, "tags/tag_detail.html", context)
 
 
+# Queries shorter than this return no suggestions instead of scanning
+MIN_AUTOCOMPLETE_QUERY = 2
+
+
 def tag_autocomplete(request):
     """
     View for tag autocomplete functionality.
     """
-    query = request.GET.get("q", "")
-    if query:
-        tags = Tag.objects.filter(name__icontains=query)[:10]
-        results = [{"id": tag.id, "text": tag.name} for tag in tags]
-        return JsonResponse({"results": results}, safe=False)
-    return JsonResponse({"results": []}, safe=False)
+    query = request.GET.get("q", "").strip()
+    # Strip characters that have no business in a tag name so pathological
+    # LIKE patterns never reach the fallback query
+    query = re.sub(r"[^\w\- ]", "", query)[:50]
+    if len(query) >= MIN_AUTOCOMPLETE_QUERY:
+        # Prefix match against the in-process index: no SQL at all on the
+        # common keystroke path.
+        rows = autocomplete.search(query, limit=10)
+        if not rows and len(query) >= 3:
+            # Substring search only as a fallback for longer queries
+            rows = Tag.objects.filter(name__icontains=query)
+            rows = rows.order_by("name").values_list("id", "name")[:10]
+        results = [{"id": tag_id, "text": name} for tag_id, name in rows]
+        response = JsonResponse({"results": results}, safe=False)
+    else:
+        response = JsonResponse({"results": []}, safe=False)
+    # Let repeated keystrokes for the same prefix hit the browser cache
+    response["Cache-Control"] = "public, max-age=30"
+    return response
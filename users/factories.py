@@ -0,0 +1,21 @@
+"""
+factory-boy factories for the users app.
+"""
+
+import factory
+from django.contrib.auth.models import User
+
+
+class UserFactory(factory.django.DjangoModelFactory):
+    """
+    Standard user; the password hashes to "StrongPassword123".
+    """
+
+    class Meta:
+        model = User
+
+    username = factory.Sequence(lambda n: f"user{n}")
+    email = factory.LazyAttribute(lambda o: f"{o.username}@example.com")
+    first_name = "Test"
+    last_name = "User"
+    password = factory.django.Password("StrongPassword123")
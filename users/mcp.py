@@ -1,16 +1,71 @@
+import hashlib
+import hmac
 import secrets
-from datetime import timedelta
+import time
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db import models
 from django.utils import timezone
 
+# How long a validated (or rejected) token may be served from the cache
+# before the database is consulted again
+TOKEN_CACHE_TTL = 120
+
+# Minimum seconds between last_used writes for a token; requests inside
+# the window skip the UPDATE entirely
+LAST_USED_WRITE_INTERVAL = 60
+
 
 def generate_token():
     """Generate a secure random token for MCP authentication"""
     return secrets.token_urlsafe(32)
 
 
+# Length of a generate_token() string; anything else can be rejected
+# before touching the cache or database
+TOKEN_LENGTH = len(generate_token())
+
+
+def hash_token(token_string):
+    """Hex sha256 of a raw token; stored, indexed, and used for cache keys."""
+    return hashlib.sha256(token_string.encode()).hexdigest()
+
+
+def sign_token_payload(payload):
+    """HMAC signature over a token's "{id}.{expiry}" payload."""
+    return hmac.new(
+        settings.SECRET_KEY.encode(), payload.encode(), hashlib.sha256
+    ).hexdigest()[:32]
+
+
+def verify_token_structure(token_string):
+    """
+    Cheap in-process gate run before any cache or database work.
+
+    Signed "{id}.{expiry}.{sig}" tokens are verified and expiry-checked
+    here, so forged or expired tokens never reach the lookup. Legacy
+    random tokens carry no signature; for those only the length is
+    checked and the database stays the authority.
+    """
+    parts = token_string.split(".")
+    if len(parts) != 3:
+        return len(token_string) == TOKEN_LENGTH
+    if not hmac.compare_digest(parts[2], sign_token_payload(f"{parts[0]}.{parts[1]}")):
+        return False
+    try:
+        expires = int(parts[1])
+    except ValueError:
+        return False
+    # Expiry 0 marks a token that never expires
+    return expires == 0 or expires > time.time()
+
+
+def token_cache_key(digest):
+    """Cache key for a hashed bearer token; raw tokens never land in the cache."""
+    return f"mcp:tok:{digest}"
+
+
 class MCPToken(models.Model):
     """
     Model for storing MCP (Model Context Protocol) tokens for users.
@@ -21,6 +76,12 @@ class MCPToken(models.Model):
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="mcp_tokens"
     )
     token = models.CharField(max_length=64, default=generate_token, unique=True)
+    token_hash = models.CharField(
+        max_length=64,
+        unique=True,
+        editable=False,
+        help_text="sha256 of the token; authentication looks this up",
+    )
     name = models.CharField(
         max_length=100, help_text="A name to help you identify this token"
     )
@@ -32,15 +93,34 @@ class MCPToken(models.Model):
     class Meta:
         verbose_name = "MCP Token"
         verbose_name_plural = "MCP Tokens"
+        indexes = [
+            # Token management page: WHERE user_id = ? ORDER BY created_at DESC
+            models.Index(
+                fields=["user", "-created_at"],
+                name="mcp_user_created_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.user.username})"
 
     def save(self, *args, **kwargs):
-        # Set default expiration if not provided (1 year from creation)
-        if not self.expires_at:
-            self.expires_at = timezone.now() + timedelta(days=365)
+        creating = self.pk is None
+        self.token_hash = hash_token(self.token)
         super().save(*args, **kwargs)
+        if creating:
+            # Rewrite the random placeholder as a self-validating
+            # "{id}.{expiry}.{sig}" token; the id only exists after the
+            # first INSERT, hence the two-step save. A null expires_at
+            # means the token never expires and is signed as expiry 0
+            expiry = int(self.expires_at.timestamp()) if self.expires_at else 0
+            payload = f"{self.pk}.{expiry}"
+            self.token = f"{payload}.{sign_token_payload(payload)}"
+            self.token_hash = hash_token(self.token)
+            super().save(update_fields=["token", "token_hash"])
+        # Drop the cached validation entry so revocation and other state
+        # changes take effect immediately, not after the TTL
+        cache.delete(token_cache_key(self.token_hash))
 
     def is_valid(self):
         """Check if the token is valid (active and not expired)"""
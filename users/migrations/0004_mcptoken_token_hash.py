@@ -0,0 +1,38 @@
+import hashlib
+
+from django.db import migrations, models
+
+
+def backfill_token_hash(apps, schema_editor):
+    MCPToken = apps.get_model("users", "MCPToken")
+    for token in MCPToken.objects.filter(token_hash="").iterator():
+        MCPToken.objects.filter(pk=token.pk).update(
+            token_hash=hashlib.sha256(token.token.encode()).hexdigest()
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0003_usersettings"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mcptoken",
+            name="token_hash",
+            field=models.CharField(default="", editable=False, max_length=64),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_token_hash, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="mcptoken",
+            name="token_hash",
+            field=models.CharField(
+                editable=False,
+                help_text="sha256 of the token; authentication looks this up",
+                max_length=64,
+                unique=True,
+            ),
+        ),
+    ]
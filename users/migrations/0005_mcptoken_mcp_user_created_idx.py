@@ -0,0 +1,19 @@
+# Generated by Django 4.2.23 on 2026-08-28 08:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0004_mcptoken_token_hash"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="mcptoken",
+            index=models.Index(
+                fields=["user", "-created_at"], name="mcp_user_created_idx"
+            ),
+        ),
+    ]
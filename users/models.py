@@ -1,8 +1,15 @@
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.db import models
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+# The public profile page caches its most-used-tags card per user; the
+# TTL bounds staleness from writes the invalidation below cannot see
+# (tag assignments on an existing solution)
+TOP_TAGS_CACHE_KEY = "top_tags:{user_id}"
+TOP_TAGS_CACHE_TTL = 60
+
 
 class UserProfile(models.Model):
     """
@@ -93,3 +100,11 @@ def create_user_settings(sender, instance, created, **kwargs):
 def save_user_settings(sender, instance, **kwargs):
     if hasattr(instance, "settings"):
         instance.settings.save()
+
+
+# Drop a user's cached top-tags card whenever one of their solutions
+# changes
+@receiver(post_save, sender="solutions.Solution")
+@receiver(post_delete, sender="solutions.Solution")
+def invalidate_top_tags(sender, instance, **kwargs):
+    cache.delete(TOP_TAGS_CACHE_KEY.format(user_id=instance.author_id))
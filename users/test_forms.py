@@ -0,0 +1,24 @@
+"""
+Form-only tests: no request/response cycle, and with built (unsaved)
+factory instances, no database either.
+"""
+
+from users.factories import UserFactory
+from users.forms import UserDeleteForm
+
+
+def test_delete_form_rejects_incorrect_password(nodb_factories):
+    """The deletion form checks the password against the in-memory hash."""
+    user = UserFactory()
+    assert user.pk is None  # build strategy: nothing was saved
+
+    form = UserDeleteForm(user=user, data={"password": "WrongPassword"})
+    assert form.is_valid() is False
+    assert "Incorrect password. Please try again." in form.errors["password"]
+
+
+def test_delete_form_accepts_correct_password(nodb_factories):
+    user = UserFactory()
+
+    form = UserDeleteForm(user=user, data={"password": "StrongPassword123"})
+    assert form.is_valid() is True
@@ -0,0 +1,165 @@
+"""
+Regression tests for the MCP bearer-token scheme: signed tokens,
+legacy random tokens, revocation, and the JSON-RPC batch path.
+"""
+
+import json
+import time
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from . import mcp_api
+from .mcp import (
+    MCPToken,
+    generate_token,
+    hash_token,
+    sign_token_payload,
+    verify_token_structure,
+)
+
+
+class MCPTokenAuthTests(TestCase):
+    """
+    Tests for MCP token creation, validation, and endpoint auth.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="StrongPassword123"
+        )
+        cls.endpoint = reverse("mcp_endpoint")
+
+    def setUp(self):
+        # Token validation results are cached; start each test cold
+        cache.clear()
+
+    def _post(self, payload, token):
+        return self.client.post(
+            self.endpoint,
+            data=json.dumps(payload),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {token}",
+        )
+
+    def _list_tools(self, token, request_id=1):
+        return self._post(
+            {"jsonrpc": "2.0", "method": "list_tools", "id": request_id}, token
+        )
+
+    def test_token_is_signed_on_create(self):
+        """New tokens are rewritten to the signed {id}.{expiry}.{sig} form."""
+        token = MCPToken.objects.create(user=self.user, name="test")
+        parts = token.token.split(".")
+        self.assertEqual(len(parts), 3)
+        self.assertEqual(parts[0], str(token.pk))
+        self.assertEqual(token.token_hash, hash_token(token.token))
+        self.assertTrue(verify_token_structure(token.token))
+
+    def test_valid_token_authenticates(self):
+        """A signed token passes endpoint authentication."""
+        token = MCPToken.objects.create(user=self.user, name="test")
+        response = self._list_tools(token.token)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("tools", response.json()["result"])
+
+    def test_forged_signature_is_rejected(self):
+        """Tampering with the payload or signature fails before any lookup."""
+        token = MCPToken.objects.create(user=self.user, name="test")
+        token_id, expiry, sig = token.token.split(".")
+
+        forged_sig = token_id + "." + expiry + "." + "0" * len(sig)
+        self.assertFalse(verify_token_structure(forged_sig))
+
+        forged_payload = f"{int(token_id) + 1}.{expiry}.{sig}"
+        self.assertFalse(verify_token_structure(forged_payload))
+
+        response = self._list_tools(forged_sig)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()["error"]["code"], -32001)
+
+    def test_expired_signed_token_is_rejected(self):
+        """A correctly signed but expired token fails the structure check."""
+        payload = f"1.{int(time.time()) - 60}"
+        expired = f"{payload}.{sign_token_payload(payload)}"
+        self.assertFalse(verify_token_structure(expired))
+
+        response = self._list_tools(expired)
+        self.assertEqual(response.status_code, 401)
+
+    def test_never_expiring_token(self):
+        """An explicit null expiry is kept, not coerced to one year."""
+        token = MCPToken.objects.create(user=self.user, name="test", expires_at=None)
+        self.assertIsNone(token.expires_at)
+        self.assertEqual(token.token.split(".")[1], "0")
+        self.assertTrue(verify_token_structure(token.token))
+
+        response = self._list_tools(token.token)
+        self.assertEqual(response.status_code, 200)
+
+    def test_legacy_random_token_authenticates(self):
+        """Pre-rewrite random tokens still pass via the length fallback."""
+        token = MCPToken.objects.create(user=self.user, name="legacy")
+        legacy = generate_token()
+        # Simulate a row created before the signed format existed
+        MCPToken.objects.filter(pk=token.pk).update(
+            token=legacy, token_hash=hash_token(legacy)
+        )
+
+        self.assertTrue(verify_token_structure(legacy))
+        response = self._list_tools(legacy)
+        self.assertEqual(response.status_code, 200)
+
+    def test_revocation_invalidates_cached_token(self):
+        """Revoking a token takes effect immediately, not after the TTL."""
+        token = MCPToken.objects.create(user=self.user, name="test")
+
+        # Warm the validation cache with a successful request
+        self.assertEqual(self._list_tools(token.token).status_code, 200)
+
+        token.revoke()
+        response = self._list_tools(token.token)
+        self.assertEqual(response.status_code, 401)
+
+    def test_batch_round_trip(self):
+        """A batch returns one response per entry, ids preserved."""
+        token = MCPToken.objects.create(user=self.user, name="test")
+        batch = [
+            {"jsonrpc": "2.0", "method": "list_tools", "id": 1},
+            {"jsonrpc": "2.0", "method": "list_solutions", "params": {}, "id": 2},
+        ]
+        response = self._post(batch, token.token)
+        self.assertEqual(response.status_code, 200)
+
+        responses = response.json()
+        self.assertEqual([r["id"] for r in responses], [1, 2])
+        self.assertIn("tools", responses[0]["result"])
+        self.assertEqual(responses[1]["result"]["solutions"], [])
+
+    def test_non_string_cursor_is_ignored(self):
+        """A numeric cursor is treated like any other malformed cursor."""
+        token = MCPToken.objects.create(user=self.user, name="test")
+        response = self._post(
+            {
+                "jsonrpc": "2.0",
+                "method": "list_solutions",
+                "params": {"cursor": 123},
+                "id": 1,
+            },
+            token.token,
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["result"]["solutions"], [])
+
+    def test_batch_without_orjson(self):
+        """The stdlib fallback serializes batch (array) responses too."""
+        token = MCPToken.objects.create(user=self.user, name="test")
+        batch = [{"jsonrpc": "2.0", "method": "list_tools", "id": 1}]
+        with mock.patch.object(mcp_api, "orjson", None):
+            response = self._post(batch, token.token)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]["id"], 1)
@@ -0,0 +1,51 @@
+"""
+Profile view tests driven by the shared ``client_logged_in`` fixture.
+"""
+
+from django.urls import reverse
+
+
+def test_profile_page_loads_for_authenticated_user(
+    client_logged_in, django_assert_num_queries
+):
+    """The profile page loads correctly for an authenticated user."""
+    with django_assert_num_queries(5):
+        response = client_logged_in.get(reverse("users:profile"))
+    assert response.status_code == 200
+    assert "users/profile.html" in [t.name for t in response.templates]
+
+
+def test_profile_update(client_logged_in):
+    """A user can update their profile."""
+    profile_url = reverse("users:profile")
+    profile_data = {
+        "first_name": "Updated",
+        "last_name": "User",
+        "email": "updated@example.com",
+        "bio": "This is my updated bio.",
+        "skills": "Python, Django, Testing",
+        "experience": "I have experience in web development.",
+        "website": "https://example.com",
+        "github": "https://github.com/testuser",
+        "twitter": "https://twitter.com/testuser",
+        "linkedin": "https://linkedin.com/in/testuser",
+    }
+
+    response = client_logged_in.post(profile_url, profile_data)
+    assert response.status_code == 302
+    assert response.url == profile_url
+
+    user = client_logged_in.user
+    user.refresh_from_db()
+    profile = user.profile
+
+    assert user.first_name == profile_data["first_name"]
+    assert user.last_name == profile_data["last_name"]
+    assert user.email == profile_data["email"]
+    assert profile.bio == profile_data["bio"]
+    assert profile.skills == profile_data["skills"]
+    assert profile.experience == profile_data["experience"]
+    assert profile.website == profile_data["website"]
+    assert profile.github == profile_data["github"]
+    assert profile.twitter == profile_data["twitter"]
+    assert profile.linkedin == profile_data["linkedin"]
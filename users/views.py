@@ -1,5 +1,7 @@
+from collections import Counter
 from datetime import timedelta
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import logout
 from django.contrib.auth.decorators import login_required
@@ -10,14 +12,14 @@ from django.contrib.auth.views import (
     PasswordResetConfirmView,
     PasswordResetView,
 )
-from django.db.models import Avg, Count, Sum
+from django.core.cache import cache
+from django.db.models import Avg
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse_lazy
 from django.utils import timezone
 from django.views.generic import CreateView
 
 from solutions.models import Solution
-from tags.models import Tag
 
 from .forms import (
     CustomAuthenticationForm,
@@ -27,7 +29,26 @@ from .forms import (
     UserSettingsForm,
 )
 from .mcp import MCPToken
-from .models import UserSettings
+from .models import TOP_TAGS_CACHE_KEY, TOP_TAGS_CACHE_TTL, UserSettings
+
+# Path the MCP endpoint is served from. When SITE_URL is configured the
+# display URL is fixed at import time; otherwise it is derived from the
+# request's host and scheme
+MCP_ENDPOINT_PATH = "/api/mcp/"
+MCP_ENDPOINT_URL = (
+    f"{settings.SITE_URL}{MCP_ENDPOINT_PATH}" if settings.SITE_URL else None
+)
+
+# Token lifetimes offered by the creation form; anything else falls back
+# to the one-year default and "0" means no expiry. A closed set also
+# keeps arbitrary client-supplied day counts out of the arithmetic
+EXPIRY_CHOICES = {
+    "30": timedelta(days=30),
+    "90": timedelta(days=90),
+    "180": timedelta(days=180),
+    "365": timedelta(days=365),
+    "0": None,
+}
 
 
 class RegisterView(CreateView):
@@ -76,47 +97,72 @@ class CustomLogoutView(LogoutView):
         return super().dispatch(request, *args, **kwargs)
 
 
+def get_user_with_profile(request):
+    """
+    Reload request.user with its profile joined in the same query,
+    instead of paying a second SELECT when the profile is accessed.
+
+    The preloaded user replaces request.user so template code touching
+    user.profile (the navbar avatar) reuses the join too.
+    """
+    user = User.objects.select_related("profile").get(pk=request.user.pk)
+    request.user = user
+    return user
+
+
 def user_profile_view(request, username):
     """
     View for displaying other users' profiles with comprehensive statistics and data.
     """
-    viewed_user = get_object_or_404(User, username=username)
-    profile = viewed_user.profile
-    solutions = (
-        Solution.objects.filter(author=viewed_user, is_published=True)
-        .select_related("author")
-        .prefetch_related("tags", "ratings")
+    viewed_user = get_object_or_404(
+        User.objects.select_related("profile"), username=username
     )
+    profile = viewed_user.profile
 
-    # Calculate user statistics
-    total_solutions = solutions.count()
-    total_views = solutions.aggregate(total_views=Sum("view_count"))["total_views"] or 0
-    avg_rating = (
-        solutions.annotate(avg_rating=Avg("ratings__value")).aggregate(
-            total_avg=Avg("avg_rating")
-        )["total_avg"]
-        or 0
+    # Fetch the user's solutions once, with ratings averaged in the same
+    # query; every statistic and slice below works off this list instead
+    # of issuing its own aggregate query. The markdown source and
+    # rendered HTML are by far the widest columns and the page never
+    # shows them, so they stay in the database
+    solutions = list(
+        Solution.objects.filter(author=viewed_user, is_published=True)
+        .defer("content", "content_html")
+        .prefetch_related("tags")
+        .annotate(avg_rating=Avg("ratings__value"))
     )
 
-    # Get most used tags
-    top_tags = (
-        Tag.objects.filter(solutions__author=viewed_user, solutions__is_published=True)
-        .annotate(usage_count=Count("solutions"))
-        .order_by("-usage_count")[:5]
-    )
+    # Calculate user statistics from the cached list
+    total_solutions = len(solutions)
+    total_views = sum(s.view_count for s in solutions)
+    rated = [s.avg_rating for s in solutions if s.avg_rating is not None]
+    avg_rating = sum(rated) / len(rated) if rated else 0
+
+    # Get most used tags, counted over the prefetched tag lists instead
+    # of another aggregate query, and cached briefly per user
+    top_tags_key = TOP_TAGS_CACHE_KEY.format(user_id=viewed_user.pk)
+    top_tags = cache.get(top_tags_key)
+    if top_tags is None:
+        tag_counts = Counter(tag for s in solutions for tag in s.tags.all())
+        top_tags = []
+        for tag, count in tag_counts.most_common(5):
+            tag.usage_count = count
+            top_tags.append(tag)
+        cache.set(top_tags_key, top_tags, TOP_TAGS_CACHE_TTL)
 
     # Get recent activity (newest solutions)
-    recent_solutions = solutions.order_by("-created_at")[:5]
+    recent_solutions = sorted(solutions, key=lambda s: s.created_at, reverse=True)[:5]
 
     # Get top rated solutions
-    top_rated_solutions = (
-        solutions.annotate(avg_rating=Avg("ratings__value"))
-        .filter(avg_rating__isnull=False)
-        .order_by("-avg_rating")[:5]
-    )
+    top_rated_solutions = sorted(
+        (s for s in solutions if s.avg_rating is not None),
+        key=lambda s: s.avg_rating,
+        reverse=True,
+    )[:5]
 
     # Get most viewed solutions
-    most_viewed_solutions = solutions.order_by("-view_count")[:5]
+    most_viewed_solutions = sorted(solutions, key=lambda s: s.view_count, reverse=True)[
+        :5
+    ]
 
     context = {
         "viewed_user": viewed_user,
@@ -142,7 +188,7 @@ def profile_view(request):
     """
     View for displaying and updating user profile.
     """
-    profile = request.user.profile
+    profile = get_user_with_profile(request).profile
 
     if request.method == "POST":
         form = UserProfileForm(request.POST, request.FILES, instance=profile)
@@ -230,12 +276,24 @@ def mcp_tokens_view(request):
     """
     View for managing MCP tokens.
     """
-    tokens = MCPToken.objects.filter(user=request.user).order_by("-created_at")
+    # Project to the columns the template renders; token_hash stays in
+    # the database
+    tokens = (
+        MCPToken.objects.filter(user=request.user)
+        .only(
+            "id",
+            "token",
+            "name",
+            "created_at",
+            "last_used",
+            "expires_at",
+            "is_active",
+        )
+        .order_by("-created_at")
+    )
 
     # Build the MCP endpoint URL for display
-    host = request.get_host()
-    protocol = "https" if request.is_secure() else "http"
-    mcp_endpoint = f"{protocol}://{host}/api/mcp/"
+    mcp_endpoint = MCP_ENDPOINT_URL or request.build_absolute_uri(MCP_ENDPOINT_PATH)
 
     context = {
         "tokens": tokens,
@@ -251,7 +309,7 @@ def create_mcp_token(request):
     """
     if request.method == "POST":
         name = request.POST.get("name", "").strip()
-        expiry_days = int(request.POST.get("expiry", 365))
+        expiry = request.POST.get("expiry", "365")
 
         if not name:
             messages.error(request, "Token name is required.")
@@ -261,8 +319,9 @@ def create_mcp_token(request):
         token = MCPToken(user=request.user, name=name)
 
         # Set expiration date if specified
-        if expiry_days > 0:
-            token.expires_at = timezone.now() + timedelta(days=expiry_days)
+        delta = EXPIRY_CHOICES.get(expiry, EXPIRY_CHOICES["365"])
+        if delta is not None:
+            token.expires_at = timezone.now() + delta
         else:
             token.expires_at = None
 